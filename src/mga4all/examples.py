@@ -1,5 +1,7 @@
+import functools
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pypsa
 
@@ -21,19 +23,51 @@ def load_from_cache_or_fetch_scigrid_de():
     return network
 
 
+@functools.lru_cache(maxsize=1)
+def _get_scigrid_arrays() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract the demand, solar and wind profiles from scigrid_de once per process.
+
+    The arrays are shared between calls, so they are marked read-only.
+    """
+    base_network = load_from_cache_or_fetch_scigrid_de()
+    profiles = (
+        base_network.loads_t.p_set["382_220kV"],
+        base_network.generators_t.p_max_pu["384_220kV Solar"],
+        base_network.generators_t.p_max_pu["457 Wind Onshore"],
+    )
+    arrays = tuple(
+        profile.to_numpy(dtype=np.float64, copy=True) for profile in profiles
+    )
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@functools.lru_cache(maxsize=8)
+def _snapshots(num_snapshots: int) -> pd.DatetimeIndex:
+    """Hourly snapshots of the example network, shared between networks of the same length."""
+    return pd.date_range("2025-01-01", periods=num_snapshots, freq="h")
+
+
+def _profile_per_column(
+    profile: np.ndarray, snapshots: pd.Index, names: list[str]
+) -> pd.DataFrame:
+    """Repeat a single time series for every component in `names` without copying it."""
+    values = np.broadcast_to(profile[:, np.newaxis], (len(profile), len(names)))
+    return pd.DataFrame(values, index=snapshots, columns=names)
+
+
 def create_pypsa_network(num_snapshots=24) -> pypsa.Network:
     """Create a simple PyPSA network."""
-    base_network = load_from_cache_or_fetch_scigrid_de()
-    example_network = pypsa.Network(
-        snapshots=pd.date_range("2025-01-01", periods=num_snapshots, freq="h")
+    demand, solar_pu, wind_pu = (
+        profile[:num_snapshots] for profile in _get_scigrid_arrays()
     )
+    example_network = pypsa.Network(snapshots=_snapshots(num_snapshots))
 
     carriers = ["AC", "transmission", "gas", "solar", "wind", "battery"]
-    for car in carriers:
-        example_network.add("Carrier", car)
+    example_network.add("Carrier", carriers)
 
-    example_network.add("Bus", "bus1", carrier="AC")
-    example_network.add("Bus", "bus2", carrier="AC")
+    example_network.add("Bus", ["bus1", "bus2"], carrier="AC")
 
     example_network.add(
         "Line",
@@ -65,55 +99,54 @@ def create_pypsa_network(num_snapshots=24) -> pypsa.Network:
         "Load",
         "demand",
         bus="bus2",
-        p_set=base_network.loads_t.p_set.loc[:, "382_220kV"].values[:num_snapshots],
+        p_set=demand,
     )
 
-    # Add candidate technologies to be built at either buses
-    for bus in example_network.buses.index:
-        example_network.add(
-            "Generator",
-            f"solar_{bus}",
-            carrier="solar",
-            bus=bus,
-            p_nom=0,
-            p_nom_extendable=True,
-            p_nom_max=1000,
-            capital_cost=400,
-            marginal_cost=0,
-            p_max_pu=base_network.generators_t.p_max_pu.loc[
-                :, "384_220kV Solar"
-            ].values[:num_snapshots],
-        )
-
-        example_network.add(
-            "Generator",
-            f"wind_{bus}",
-            carrier="wind",
-            bus=bus,
-            p_nom=0,
-            p_nom_extendable=True,
-            p_nom_max=1000,
-            capital_cost=500,
-            marginal_cost=0,
-            p_max_pu=base_network.generators_t.p_max_pu.loc[
-                :, "457 Wind Onshore"
-            ].values[:num_snapshots],
-        )
-
-        example_network.add(
-            "StorageUnit",
-            f"battery_{bus}",
-            carrier="battery",
-            bus=bus,
-            p_nom=0,
-            p_nom_extendable=True,
-            p_nom_max=300,
-            max_hours=5,
-            capital_cost=500,
-            marginal_cost=0,
-            efficiency_store=0.95,
-            efficiency_dispatch=0.95,
-            cyclic_state_of_charge=False,
-        )
+    # Add candidate technologies to be built at either buses, one batched add per technology
+    buses = list(example_network.buses.index)
+    solar_names = [f"solar_{bus}" for bus in buses]
+    wind_names = [f"wind_{bus}" for bus in buses]
+
+    example_network.add(
+        "Generator",
+        solar_names,
+        carrier="solar",
+        bus=buses,
+        p_nom=0,
+        p_nom_extendable=True,
+        p_nom_max=1000,
+        capital_cost=400,
+        marginal_cost=0,
+        p_max_pu=_profile_per_column(solar_pu, example_network.snapshots, solar_names),
+    )
+
+    example_network.add(
+        "Generator",
+        wind_names,
+        carrier="wind",
+        bus=buses,
+        p_nom=0,
+        p_nom_extendable=True,
+        p_nom_max=1000,
+        capital_cost=500,
+        marginal_cost=0,
+        p_max_pu=_profile_per_column(wind_pu, example_network.snapshots, wind_names),
+    )
+
+    example_network.add(
+        "StorageUnit",
+        [f"battery_{bus}" for bus in buses],
+        carrier="battery",
+        bus=buses,
+        p_nom=0,
+        p_nom_extendable=True,
+        p_nom_max=300,
+        max_hours=5,
+        capital_cost=500,
+        marginal_cost=0,
+        efficiency_store=0.95,
+        efficiency_dispatch=0.95,
+        cyclic_state_of_charge=False,
+    )
 
     return example_network
@@ -170,14 +170,31 @@ def set_weights_random(asset_indices: pd.MultiIndex, upper_bound: int) -> pd.Ser
     return pd.Series(weights, index=asset_indices, name="weights")
 
 
+def _get_asset_values(
+    n: pypsa.Network, asset_indices: pd.MultiIndex, *suffixes: str
+) -> np.ndarray:
+    """Look up the `<attribute><suffix>` columns (e.g. `p_nom_opt`) for all assets in `asset_indices`.
+
+    Assets are grouped by component and attribute so that each component's columns are indexed once, instead of once
+    per asset. Returns one row per suffix, in the order of `suffixes`.
+    """
+    groups: dict[tuple[str, str], tuple[list[int], list[str]]] = {}
+    for position, (component, capacity_attr, asset) in enumerate(asset_indices):
+        positions, assets = groups.setdefault((component, capacity_attr), ([], []))
+        positions.append(position)
+        assets.append(asset)
+
+    values = np.empty((len(suffixes), len(asset_indices)), dtype=np.float64)
+    for (component, capacity_attr), (positions, assets) in groups.items():
+        df = getattr(n, PYPSA_DATAFRAME_NAMES[component])
+        columns = [f"{capacity_attr}{suffix}" for suffix in suffixes]
+        values[:, positions] = df.loc[assets, columns].to_numpy(dtype=np.float64).T
+    return values
+
+
 def get_tech_deployment(n: pypsa.Network, asset_indices: pd.MultiIndex) -> pd.Series:
     """Get the deployed capacity (p_nom_opt) of spore techs in the optimized network."""
-    deployment_values = []
-    for component, capacity_attr, asset in asset_indices:
-        df_name = PYPSA_DATAFRAME_NAMES[component]
-        df = getattr(n, df_name)
-        deployment_values.append(df[f"{capacity_attr}_opt"][asset])
-
+    (deployment_values,) = _get_asset_values(n, asset_indices, "_opt")
     return pd.Series(deployment_values, index=asset_indices, name="deployment")
 
 
@@ -185,18 +202,12 @@ def calculate_relative_deployment(
     n: pypsa.Network, asset_indices: pd.MultiIndex, bigM: float = 1e10
 ) -> pd.Series:
     """Calculate the relative deployment (p_nom_opt/p_nom_max) of techs in the optimized network."""
-    relative_deployment = []
-    for component, capacity_attr, asset in asset_indices:
-        df_name = PYPSA_DATAFRAME_NAMES[component]
-        df = getattr(n, df_name)
-
-        # set actual value in case max is infinite
-        max_caps = min(df[f"{capacity_attr}_max"][asset], bigM)
-        opt_caps = df[f"{capacity_attr}_opt"][asset]
-        relative_deployment.append(opt_caps / max_caps)
+    opt_caps, max_caps = _get_asset_values(n, asset_indices, "_opt", "_max")
+    # set actual value in case max is infinite
+    max_caps = np.minimum(max_caps, bigM)
 
     return pd.Series(
-        relative_deployment, index=asset_indices, name="relative deployment"
+        opt_caps / max_caps, index=asset_indices, name="relative deployment"
     )
 
 
@@ -205,7 +216,11 @@ def calculate_weights_relative_deployment(
 ) -> pd.Series:
     """Calculate new weights by adding the latest relative deployment to the previous weights."""
     relative_deployment = calculate_relative_deployment(n, prev_weights.index)
-    return prev_weights + relative_deployment
+    # Both share `prev_weights.index` by construction, so add the arrays directly instead of aligning the indices.
+    return pd.Series(
+        prev_weights.to_numpy() + relative_deployment.to_numpy(),
+        index=prev_weights.index,
+    )
 
 
 def calculate_weights_relative_deployment_normalized(
@@ -222,14 +237,49 @@ def calculate_weights_relative_deployment_normalized(
     return new_weights
 
 
+def _stack_deployment_history(
+    deployment_history: Iterable[pd.Series],
+) -> tuple[np.ndarray, pd.Index]:
+    """Stack the deployment history into an (assets x spores) array.
+
+    Deployments returned by `get_tech_deployment` share the same index, so they can be stacked directly; otherwise
+    they are aligned with `pd.concat`, and missing assets show up as NaN.
+    """
+    history = list(deployment_history)
+    if not history:
+        raise ValueError("The deployment history must contain at least one deployment.")
+    index = history[0].index
+    if all(deployment.index.equals(index) for deployment in history[1:]):
+        values = [deployment.to_numpy(dtype=np.float64) for deployment in history]
+        return np.column_stack(values), index
+
+    aligned = pd.concat(history, axis="columns")
+    return aligned.to_numpy(dtype=np.float64), aligned.index
+
+
+def _reduce_deployment_history(
+    deployment_history: Iterable[pd.Series], reducer: Callable
+) -> pd.Series:
+    """Reduce the stacked deployment history per asset with a NaN-skipping `reducer`.
+
+    Like pandas, assets that only have NaN deployments get NaN. They are left out of the reduction, because numpy warns
+    about all-NaN slices.
+    """
+    values, index = _stack_deployment_history(deployment_history)
+    reduced = np.full(len(index), np.nan)
+    has_data = ~np.isnan(values).all(axis=1)
+    reduced[has_data] = reducer(values[has_data], axis=1)
+    return pd.Series(reduced, index=index)
+
+
 def average_deployment(deployment_history: Iterable[pd.Series]) -> pd.Series:
     """Calculates the average capacity deployment of spore technologies."""
-    return pd.concat(deployment_history, axis="columns").mean(axis=1)
+    return _reduce_deployment_history(deployment_history, np.nanmean)
 
 
 def median_deployment(deployment_history: Iterable[pd.Series]) -> pd.Series:
     """Calculates the median capacity deployment of spore technologies."""
-    return pd.concat(deployment_history, axis="columns").median(axis=1)
+    return _reduce_deployment_history(deployment_history, np.nanmedian)
 
 
 def calculate_weights_evolving(
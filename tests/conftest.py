@@ -1,10 +1,13 @@
+from types import SimpleNamespace
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from mga4all.examples import create_pypsa_network
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def asset_indices():
     """Fixture for the SPORE technologies dictionary."""
     return pd.MultiIndex.from_tuples(
@@ -17,32 +20,76 @@ def asset_indices():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def interleaved_asset_indices():
+    """Asset indices alternating between components, so components are not contiguous."""
+    return pd.MultiIndex.from_tuples(
+        [
+            ("Generator", "p_nom", "wind"),
+            ("StorageUnit", "p_nom", "battery"),
+            ("Line", "s_nom", "line"),
+            ("Generator", "p_nom", "solar"),
+            ("StorageUnit", "p_nom", "hydro"),
+        ],
+        names=["component", "attribute", "asset"],
+    )
+
+
+@pytest.fixture
+def mixed_component_network():
+    """A network stand-in with generators, storage units and lines, in a different order than the asset indices."""
+    return SimpleNamespace(
+        generators=pd.DataFrame(
+            {"p_nom_opt": [10.0, 30.0, 5.0], "p_nom_max": [20.0, 60.0, np.inf]},
+            index=["solar", "wind", "gas"],
+        ),
+        storage_units=pd.DataFrame(
+            {"p_nom_opt": [8.0, 4.0], "p_nom_max": [16.0, 40.0]},
+            index=["hydro", "battery"],
+        ),
+        lines=pd.DataFrame(
+            {"s_nom_opt": [250.0], "s_nom_max": [1000.0]}, index=["line"]
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
 def pypsa_network():
     yield create_pypsa_network()
 
 
+_EMPTY_INDEX = pd.Index([])
+
+
 class MockPypsaNetwork:
     """A mock object that mimics a pypsa.Network for testing purposes.
 
     It's designed to work with the `calculate_relative_deployment` function.
     """
 
+    __slots__ = ("_index", "generators")
+
     def __init__(self, p_nom_opt_data, p_nom_max_data=None):
-        techs = list(p_nom_opt_data.keys())
-        p_nom_opt = list(p_nom_opt_data.values())
+        techs, p_nom_opt = zip(*p_nom_opt_data.items()) if p_nom_opt_data else ((), ())
+        self._index = pd.Index(techs)
 
         # Assume p_nom_max is 1.0 for all techs for simplicity, unless specified
         if p_nom_max_data is None:
-            p_nom_max = [1.0] * len(techs)
+            p_nom_max = np.ones(len(techs))
+        elif len(p_nom_max_data) != len(techs):
+            raise ValueError("p_nom_max_data must have one value per tech.")
         else:
-            p_nom_max = list(p_nom_max_data.values())
+            p_nom_max = np.fromiter(
+                p_nom_max_data.values(), dtype=np.float64, count=len(p_nom_max_data)
+            )
 
         self.generators = pd.DataFrame(
-            {"p_nom_opt": p_nom_opt, "p_nom_max": p_nom_max}, index=techs
+            {
+                "p_nom_opt": np.fromiter(p_nom_opt, dtype=np.float64, count=len(techs)),
+                "p_nom_max": p_nom_max,
+            },
+            index=self._index,
         )
 
     def get_extendable_i(self, component):
-        if component == "Generator":
-            return self.generators.index
-        return pd.Index([])
+        return self._index if component == "Generator" else _EMPTY_INDEX
@@ -10,8 +10,16 @@ from mga4all.spores import (
 )
 
 
+@pytest.fixture(scope="module")
+def real_linexpr():
+    """A simple, real linear expression, built once per module."""
+    m_real = linopy.Model()
+    x = m_real.add_variables(name="x")
+    return 10 * x
+
+
 @pytest.fixture
-def mock_pypsa_and_linopy_env(mocker):
+def mock_pypsa_and_linopy_env(mocker, real_linexpr):
     """Sets up a comprehensive mock environment for testing the orchestration of model creation and optimization."""
     # 1. Mock the PyPSA Network and its optimize attribute
     mock_network = MagicMock(name="MockPypsaNetwork")
@@ -22,11 +30,7 @@ def mock_pypsa_and_linopy_env(mocker):
 
     # 3. Mock the objective expression
     # We need a real LinearExpression to test the constraint math
-    m_real = linopy.Model()
-    x = m_real.add_variables(name="x")
-    mock_objective_expr = 10 * x  # A simple, real expression
-
-    mock_model.objective = mock_objective_expr
+    mock_model.objective = real_linexpr
 
     # 4. Set up the return value for create_model
     mock_network.optimize.create_model.return_value = mock_model
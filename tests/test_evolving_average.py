@@ -1,6 +1,8 @@
 """Tests for evolving_average weighting method."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from .conftest import MockPypsaNetwork
 
@@ -24,6 +26,20 @@ def test_get_tech_deployment(asset_indices):
     pd.testing.assert_series_equal(actual, expected)
 
 
+def test_get_tech_deployment_interleaved_components(
+    mixed_component_network, interleaved_asset_indices
+):
+    """Tests that deployments are returned in the order of the asset indices across components."""
+    expected = pd.Series(
+        [30.0, 4.0, 250.0, 10.0, 8.0],  # wind, battery, line, solar, hydro
+        index=interleaved_asset_indices,
+        name="deployment",
+    )
+
+    actual = get_tech_deployment(mixed_component_network, interleaved_asset_indices)
+    pd.testing.assert_series_equal(actual, expected)
+
+
 def test_calculate_average_deployment(asset_indices):
     """Tests that calculate_average_deployment correctly averages absolute capacities."""
     history = [
@@ -47,6 +63,44 @@ def test_calculate_average_deployment(asset_indices):
     pd.testing.assert_series_equal(actual, expected)
 
 
+def test_average_deployment_empty_history():
+    """Tests that an empty deployment history raises a clear error."""
+    with pytest.raises(ValueError, match="at least one deployment"):
+        average_deployment([])
+
+
+def test_average_deployment_mismatched_indices(asset_indices):
+    """Tests that histories with different indices are aligned, skipping missing assets."""
+    history = [
+        pd.Series([100, 200, 50], index=asset_indices),
+        pd.Series([300, 400], index=asset_indices[:2]),  # Missing gas
+    ]
+    expected = pd.Series(
+        [
+            200.0,  # average of [100, 300]
+            300.0,  # average of [200, 400]
+            50.0,  # Only one deployment of gas
+        ],
+        index=asset_indices,
+    )
+
+    actual = average_deployment(history)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+@pytest.mark.filterwarnings("error")
+def test_average_deployment_all_nan_asset(asset_indices):
+    """Tests that an asset with only NaN deployments gives NaN without warnings, like pandas."""
+    history = [
+        pd.Series([100, np.nan, 50], index=asset_indices),
+        pd.Series([300, np.nan, 0], index=asset_indices),
+    ]
+    expected = pd.Series([200.0, np.nan, 25.0], index=asset_indices)
+
+    actual = average_deployment(history)
+    pd.testing.assert_series_equal(actual, expected)
+
+
 def test_evolving_average_basic_scenario_absolute(asset_indices):
     """Tests a basic case with absolute capacities."""
     history = [
@@ -1,6 +1,8 @@
 """Tests for evolving_median weighting method."""
 
+import numpy as np
 import pandas as pd
+import pytest
 from .conftest import MockPypsaNetwork
 
 from mga4all.spores import (
@@ -53,6 +55,44 @@ def test_calculate_median_deployment_even_history(asset_indices):
     pd.testing.assert_series_equal(actual, expected)
 
 
+def test_median_deployment_empty_history():
+    """Tests that an empty deployment history raises a clear error."""
+    with pytest.raises(ValueError, match="at least one deployment"):
+        median_deployment([])
+
+
+def test_median_deployment_mismatched_indices(asset_indices):
+    """Tests that histories with different indices are aligned, skipping missing assets."""
+    history = [
+        pd.Series([100, 200, 50], index=asset_indices),
+        pd.Series([300, 400], index=asset_indices[:2]),  # Missing gas
+    ]
+    expected = pd.Series(
+        [
+            200.0,  # median of [100, 300]
+            300.0,  # median of [200, 400]
+            50.0,  # Only one deployment of gas
+        ],
+        index=asset_indices,
+    )
+
+    actual = median_deployment(history)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+@pytest.mark.filterwarnings("error")
+def test_median_deployment_all_nan_asset(asset_indices):
+    """Tests that an asset with only NaN deployments gives NaN without warnings, like pandas."""
+    history = [
+        pd.Series([100, np.nan, 50], index=asset_indices),
+        pd.Series([300, np.nan, 0], index=asset_indices),
+    ]
+    expected = pd.Series([200.0, np.nan, 25.0], index=asset_indices)
+
+    actual = median_deployment(history)
+    pd.testing.assert_series_equal(actual, expected)
+
+
 def test_calculate_weights_evolving_median_basic_scenario(asset_indices):
     """Tests a basic case with absolute capacities using the median."""
     history = [
@@ -0,0 +1,111 @@
+"""Offline tests for the example PyPSA network."""
+
+import numpy as np
+import pandas as pd
+import pypsa
+import pytest
+
+from mga4all import examples
+
+DEMAND = np.arange(10.0, 20.0)
+SOLAR_PU = np.linspace(0.0, 0.9, 10)
+WIND_PU = np.linspace(0.9, 0.0, 10)
+
+
+def make_scigrid_stand_in() -> pypsa.Network:
+    """A tiny network with the scigrid_de columns used by `create_pypsa_network`."""
+    n = pypsa.Network(snapshots=pd.date_range("2011-01-01", periods=10, freq="h"))
+    n.add("Bus", ["382_220kV", "384_220kV", "457"])
+    n.add("Load", "382_220kV", bus="382_220kV", p_set=DEMAND)
+    n.add("Generator", "384_220kV Solar", bus="384_220kV", p_max_pu=SOLAR_PU)
+    n.add("Generator", "457 Wind Onshore", bus="457", p_max_pu=WIND_PU)
+    return n
+
+
+@pytest.fixture
+def scigrid_loads(monkeypatch):
+    """Replace the scigrid_de download with a stand-in, and record how often it is loaded."""
+    loads = []
+
+    def fake_load():
+        loads.append(1)
+        return make_scigrid_stand_in()
+
+    monkeypatch.setattr(examples, "load_from_cache_or_fetch_scigrid_de", fake_load)
+    examples._get_scigrid_arrays.cache_clear()
+    yield loads
+    examples._get_scigrid_arrays.cache_clear()
+
+
+def test_create_pypsa_network_components(scigrid_loads):
+    """Tests the buses, carriers and candidate technologies of the example network."""
+    n = examples.create_pypsa_network(num_snapshots=6)
+
+    assert list(n.buses.index) == ["bus1", "bus2"]
+    assert (n.buses.carrier == "AC").all()
+    assert list(n.carriers.index) == [
+        "AC",
+        "transmission",
+        "gas",
+        "solar",
+        "wind",
+        "battery",
+    ]
+
+    assert n.generators.bus.to_dict() == {
+        "OCGT": "bus1",
+        "solar_bus1": "bus1",
+        "solar_bus2": "bus2",
+        "wind_bus1": "bus1",
+        "wind_bus2": "bus2",
+    }
+    assert n.generators.carrier.to_dict() == {
+        "OCGT": "gas",
+        "solar_bus1": "solar",
+        "solar_bus2": "solar",
+        "wind_bus1": "wind",
+        "wind_bus2": "wind",
+    }
+    assert n.storage_units.bus.to_dict() == {
+        "battery_bus1": "bus1",
+        "battery_bus2": "bus2",
+    }
+    assert (n.storage_units.carrier == "battery").all()
+
+
+def test_create_pypsa_network_time_series(scigrid_loads):
+    """Tests that every bus gets the scigrid profiles, cut to `num_snapshots`."""
+    n = examples.create_pypsa_network(num_snapshots=6)
+
+    pd.testing.assert_index_equal(
+        n.snapshots,
+        pd.date_range("2025-01-01", periods=6, freq="h"),
+        check_names=False,
+    )
+    np.testing.assert_array_equal(n.loads_t.p_set["demand"], DEMAND[:6])
+    for bus in ["bus1", "bus2"]:
+        np.testing.assert_array_equal(
+            n.generators_t.p_max_pu[f"solar_{bus}"], SOLAR_PU[:6]
+        )
+        np.testing.assert_array_equal(
+            n.generators_t.p_max_pu[f"wind_{bus}"], WIND_PU[:6]
+        )
+
+
+def test_create_pypsa_network_caches_scigrid(scigrid_loads):
+    """Tests that scigrid_de is loaded once, and that networks do not share mutable profiles."""
+    first = examples.create_pypsa_network(num_snapshots=6)
+    first.generators_t.p_max_pu.loc[:, "solar_bus1"] = 0.5
+    first.loads_t.p_set.loc[:, "demand"] = 0.0
+
+    second = examples.create_pypsa_network(num_snapshots=6)
+
+    assert len(scigrid_loads) == 1
+    assert examples._snapshots(6) is examples._snapshots(6)
+    np.testing.assert_array_equal(
+        second.generators_t.p_max_pu["solar_bus1"], SOLAR_PU[:6]
+    )
+    np.testing.assert_array_equal(
+        second.generators_t.p_max_pu["solar_bus2"], SOLAR_PU[:6]
+    )
+    np.testing.assert_array_equal(second.loads_t.p_set["demand"], DEMAND[:6])
@@ -6,6 +6,7 @@ from .conftest import MockPypsaNetwork
 
 from mga4all.spores import (
     initialize_weights,
+    calculate_relative_deployment,
     calculate_weights_relative_deployment,
     calculate_weights_relative_deployment_normalized,
 )
@@ -27,6 +28,28 @@ def test_relative_deployment_first_iteration(asset_indices):
     pd.testing.assert_series_equal(actual, expected)
 
 
+def test_calculate_relative_deployment_interleaved_components(
+    mixed_component_network, interleaved_asset_indices
+):
+    """Tests that relative deployments are returned in the order of the asset indices across components."""
+    expected = pd.Series(
+        [
+            30.0 / 60.0,  # Generator wind
+            4.0 / 40.0,  # StorageUnit battery
+            250.0 / 1000.0,  # Line line (s_nom)
+            10.0 / 20.0,  # Generator solar
+            8.0 / 16.0,  # StorageUnit hydro
+        ],
+        index=interleaved_asset_indices,
+        name="relative deployment",
+    )
+
+    actual = calculate_relative_deployment(
+        mixed_component_network, interleaved_asset_indices
+    )
+    pd.testing.assert_series_equal(actual, expected)
+
+
 def test_relative_deployment_subsequent_iteration(asset_indices):
     """Tests the cumulative sum on a subsequent iteration with non-zero previous weights."""
     # Previous weights from a prior step.